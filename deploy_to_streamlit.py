@@ -6,14 +6,44 @@ Helper script to prepare the repository for Streamlit Cloud deployment.
 import os
 import sys
 import subprocess
-import shutil
-from pathlib import Path
+import re
+
+# Heavy ML dependencies that are too large for Streamlit Cloud
+HEAVY_DEPS = frozenset({'torch', 'transformers', 'sentence-transformers', 'faiss-cpu'})
+
+# Matches a whole requirement name at the start of a line, so commented-out
+# requirements and longer names such as torch-scatter never match. Like pip,
+# names are case-insensitive and treat '-', '_' and '.' as equivalent.
+HEAVY_DEPS_RE = re.compile(
+    r'^\s*('
+    + '|'.join('[-_.]+'.join(map(re.escape, dep.split('-'))) for dep in sorted(HEAVY_DEPS))
+    + r')(?=\s*(?:[\[<>=!~;@#]|$))',
+    re.IGNORECASE
+)
+
+def normalize_requirement_name(name):
+    """Normalize a requirement name the way pip compares them."""
+    return re.sub(r'[-_.]+', '-', name).lower()
+
+# (label, path) pairs for files a Streamlit Cloud deployment needs, in the
+# order the deployment summary reports them
+SUMMARY_FILES = (
+    ('Main app', 'streamlit_app_deploy.py'),
+    ('Dependencies', 'requirements.txt'),
+    ('Config', '.streamlit/config.toml'),
+    ('Documentation', 'README.md')
+)
+
+# Files that must be present for a Streamlit Cloud deployment
+REQUIRED_FILES = frozenset(path for _, path in SUMMARY_FILES)
 
 def check_git_status():
     """Check if we're in a git repository and if there are uncommitted changes."""
     try:
-        result = subprocess.run(['git', 'status', '--porcelain'], 
-                              capture_output=True, text=True, check=True)
+        # Only emptiness of the output matters, so skip text decoding and stderr
+        result = subprocess.run(['git', 'status', '--porcelain'],
+                              stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                              check=True)
         if result.stdout.strip():
             print("⚠️  Warning: There are uncommitted changes in your repository.")
             print("   Consider committing them before deployment.")
@@ -26,19 +56,31 @@ def check_git_status():
         print("❌ Error: Git not found. Please install git.")
         return False
 
-def check_required_files():
+def list_present_files():
+    """List the top-level and .streamlit/ entries with one directory read each."""
+    present = set()
+    streamlit_dir = None
+    with os.scandir('.') as entries:
+        for entry in entries:
+            present.add(entry.name)
+            if entry.name == '.streamlit' and entry.is_dir():
+                streamlit_dir = entry.path
+
+    if streamlit_dir is not None:
+        try:
+            with os.scandir(streamlit_dir) as entries:
+                present.update(f".streamlit/{entry.name}" for entry in entries)
+        except OSError:
+            # Unreadable or replaced directory: report its files as missing
+            pass
+
+    return present
+
+def check_required_files(present=None):
     """Check if all required files for deployment exist."""
-    required_files = [
-        'streamlit_app_deploy.py',
-        'requirements.txt',
-        '.streamlit/config.toml',
-        'README.md'
-    ]
-    
-    missing_files = []
-    for file_path in required_files:
-        if not os.path.exists(file_path):
-            missing_files.append(file_path)
+    if present is None:
+        present = list_present_files()
+    missing_files = sorted(REQUIRED_FILES - present)
     
     if missing_files:
         print("❌ Missing required files for deployment:")
@@ -52,19 +94,19 @@ def check_required_files():
 def check_requirements():
     """Check if requirements.txt is optimized for Streamlit Cloud."""
     try:
-        with open('requirements.txt', 'r') as f:
-            content = f.read()
-        
         # Check for heavy ML dependencies that might cause issues
-        heavy_deps = ['torch', 'transformers', 'sentence-transformers', 'faiss-cpu']
         found_heavy = []
-        
-        for line in content.split('\n'):
-            line = line.strip()
-            if line and not line.startswith('#'):
-                for dep in heavy_deps:
-                    if dep in line:
-                        found_heavy.append(dep)
+
+        with open('requirements.txt', 'r') as f:
+            for line in f:
+                match = HEAVY_DEPS_RE.match(line)
+                if not match:
+                    continue
+                dep = normalize_requirement_name(match.group(1))
+                if dep not in found_heavy:
+                    found_heavy.append(dep)
+                    if len(found_heavy) == len(HEAVY_DEPS):
+                        break
         
         if found_heavy:
             print("⚠️  Warning: Found heavy ML dependencies in requirements.txt:")
@@ -80,34 +122,19 @@ def check_requirements():
         print("❌ Error: requirements.txt not found.")
         return False
 
-def create_deployment_summary():
+def create_deployment_summary(present=None):
     """Create a summary of deployment-ready files."""
     print("\n📋 Deployment Summary:")
     print("=" * 50)
+
+    if present is None:
+        present = list_present_files()
     
-    # Check main app file
-    if os.path.exists('streamlit_app_deploy.py'):
-        print("✅ Main app: streamlit_app_deploy.py")
-    else:
-        print("❌ Main app: streamlit_app_deploy.py (missing)")
-    
-    # Check requirements
-    if os.path.exists('requirements.txt'):
-        print("✅ Dependencies: requirements.txt")
-    else:
-        print("❌ Dependencies: requirements.txt (missing)")
-    
-    # Check config
-    if os.path.exists('.streamlit/config.toml'):
-        print("✅ Config: .streamlit/config.toml")
-    else:
-        print("❌ Config: .streamlit/config.toml (missing)")
-    
-    # Check README
-    if os.path.exists('README.md'):
-        print("✅ Documentation: README.md")
-    else:
-        print("❌ Documentation: README.md (missing)")
+    for label, file_path in SUMMARY_FILES:
+        if file_path in present:
+            print(f"✅ {label}: {file_path}")
+        else:
+            print(f"❌ {label}: {file_path} (missing)")
 
 def print_deployment_instructions():
     """Print deployment instructions."""
@@ -139,8 +166,11 @@ def main():
     # Check git status
     git_ok = check_git_status()
     
+    # List the working tree once and share it between the file checks
+    present = list_present_files()
+    
     # Check required files
-    files_ok = check_required_files()
+    files_ok = check_required_files(present)
     
     # Check requirements
     req_ok = check_requirements()
@@ -149,7 +179,7 @@ def main():
     
     if files_ok and req_ok:
         print("✅ Repository is ready for deployment!")
-        create_deployment_summary()
+        create_deployment_summary(present)
         print_deployment_instructions()
     else:
         print("❌ Repository needs attention before deployment.")
@@ -8,8 +8,6 @@ concepts without requiring heavy ML models.
 import streamlit as st
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-import json
 import time
 
 # Page configuration
@@ -124,9 +122,11 @@ MOCK_ANSWERS = {
 
 def generate_mock_answer(question):
     """Generate a mock answer for demonstration."""
+    normalized = question.lower()
+
     # Check if we have a predefined answer
     for key in MOCK_ANSWERS:
-        if question.lower() in key.lower() or key.lower() in question.lower():
+        if normalized in key.lower() or key.lower() in normalized:
             return MOCK_ANSWERS[key]
     
     # Generate a generic answer